@@ -0,0 +1,227 @@
+"""
+Skull and Roses - Batched Monte-Carlo Simulation
+
+Runs many AI-only games in lockstep on NumPy arrays instead of Player/Game objects.
+Intended for evaluating SimpleAIPlayer strategies over tens of thousands of rollouts,
+where the interactive InteractiveSkullGame is far too slow.
+
+Every per-player quantity is an int8 array of shape (n_games, n_players); each phase of
+a round is applied to all unfinished games at once.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from skull_and_roses_game import DEFAULT_STRATEGY_PARAMS, ROSE, SKULL, STRATEGY_PARAMS
+
+EMPTY = -1
+MAX_CARDS = 4
+
+class BatchedSkullSim:
+    """Lockstep simulation of n_games AI-only games with n_players seats each"""
+
+    def __init__(self, n_games: int, n_players: int, strategies: Optional[List[str]] = None,
+                 seed: Optional[int] = None, verbose: bool = False):
+        if n_players < 2 or n_players > 6:
+            raise ValueError("Game requires 2-6 players")
+        if strategies is None:
+            strategies = ["balanced"] * n_players
+        if len(strategies) != n_players:
+            raise ValueError("Need exactly one strategy per player")
+
+        self.n_games = n_games
+        self.n_players = n_players
+        self.strategies = list(strategies)
+        self.verbose = verbose
+        self.rng = np.random.default_rng(seed)
+
+        # Strategy parameters per seat, each of shape (n_players,)
+        params = np.array([STRATEGY_PARAMS.get(s, DEFAULT_STRATEGY_PARAMS) for s in self.strategies])
+        self.skull_prob, self.bid_base, self.bid_scale, self.raise_prob = params.T
+
+        shape = (n_games, n_players)
+        self.roses = np.full(shape, 3, dtype=np.int8)
+        self.skulls = np.ones(shape, dtype=np.int8)
+        self.played_roses = np.zeros(shape, dtype=np.int8)
+        self.played_skulls = np.zeros(shape, dtype=np.int8)
+        self.stacks = np.full((n_games, n_players, MAX_CARDS), EMPTY, dtype=np.int8)  # Face-down cards, bottom first
+        self.eliminated = np.zeros(shape, dtype=bool)
+        self.rounds_won = np.zeros(shape, dtype=np.int8)
+
+        self.done = np.zeros(n_games, dtype=bool)
+        self.winner = np.full(n_games, -1, dtype=np.int8)
+        self.rounds = np.zeros(n_games, dtype=np.int16)
+        self.starter = self.rng.integers(n_players, size=n_games)
+
+    def _next_seat(self, available: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """For each row, the first available seat after the given one (wrapping around)"""
+        offsets = np.arange(1, self.n_players + 1)
+        candidates = (seats[:, None] + offsets) % self.n_players
+        rows = np.arange(seats.size)
+        first = np.argmax(available[rows[:, None], candidates], axis=1)
+        return candidates[rows, first]
+
+    def _place_cards(self, games: np.ndarray, seats: np.ndarray):
+        """Each (game, seat) pair places one card face-down following its strategy"""
+        has_skull = self.skulls[games, seats] > 0
+        wants_skull = self.rng.random(games.size) < self.skull_prob[seats]
+        is_skull = np.where(wants_skull & has_skull, True, self.roses[games, seats] == 0)
+        height = self.played_roses[games, seats] + self.played_skulls[games, seats]
+
+        skull = is_skull.astype(np.int8)
+        rose = 1 - skull
+        self.stacks[games, seats, height] = skull
+        self.skulls[games, seats] -= skull
+        self.roses[games, seats] -= rose
+        self.played_skulls[games, seats] += skull
+        self.played_roses[games, seats] += rose
+
+    def _retrieve_all(self, games: np.ndarray):
+        """All players in the given games take their face-down cards back into hand"""
+        self.roses[games] += self.played_roses[games]
+        self.skulls[games] += self.played_skulls[games]
+        self.played_roses[games] = 0
+        self.played_skulls[games] = 0
+        self.stacks[games] = EMPTY
+
+    def _play_round(self, games: np.ndarray):
+        """Play one full round in every game listed in games"""
+        k = games.size
+        rows = np.arange(k)
+        active = ~self.eliminated[games]
+
+        # Phase 1: every active player places an initial card
+        g_idx, seats = np.nonzero(active)
+        self._place_cards(games[g_idx], seats)
+
+        # Phase 2: players add cards until someone starts the bidding
+        current = self.starter[games].copy()
+        placing = np.ones(k, dtype=bool)
+        while placing.any():
+            idx = np.nonzero(placing)[0]
+            g, p = games[idx], current[idx]
+            on_table = (self.played_roses[g] + self.played_skulls[g]).sum(axis=1)
+            has_cards = self.roses[g, p] + self.skulls[g, p] > 0
+            starts_bid = ~has_cards | (self.rng.random(idx.size) < self.bid_base[p] + on_table * self.bid_scale[p])
+
+            plays = ~starts_bid
+            self._place_cards(g[plays], p[plays])
+            current[idx[plays]] = self._next_seat(active[idx[plays]], p[plays])
+            placing[idx[starts_bid]] = False
+
+        # Phase 3: the starter bids 1, then players raise by one or pass
+        max_bid = (self.played_roses[games] + self.played_skulls[games]).sum(axis=1)
+        bid = np.ones(k, dtype=np.int8)
+        passed = ~active
+        current = self._next_seat(active, current)
+        bidding = np.ones(k, dtype=bool)
+        while bidding.any():
+            idx = np.nonzero(bidding)[0]
+            p = current[idx]
+            raises = (bid[idx] < max_bid[idx]) & (self.rng.random(idx.size) < self.raise_prob[p])
+            bid[idx[raises]] += 1
+            passed[idx[~raises], p[~raises]] = True
+
+            bidding[idx] = (~passed[idx]).sum(axis=1) > 1
+            still = idx[bidding[idx]]
+            current[still] = self._next_seat(~passed[still], current[still])
+        challenger = np.argmax(~passed, axis=1)
+
+        # Phase 4: build each game's reveal order (challenger's stack top-down, then random
+        # other stacks) and look for the first skull within the bid
+        g = games
+        remaining = (self.played_roses[g] + self.played_skulls[g]).astype(np.int64)
+        n_steps = int(bid.max())
+        revealed = np.full((k, n_steps), EMPTY, dtype=np.int8)
+        owner = np.full((k, n_steps), -1, dtype=np.int64)
+        for step in range(n_steps):
+            own_left = remaining[rows, challenger] > 0
+            others = remaining > 0
+            others[rows, challenger] = False
+            pick = (self.rng.random(k) * others.sum(axis=1)).astype(np.int64)
+            target = np.argmax(np.cumsum(others, axis=1) > pick[:, None], axis=1)
+            target = np.where(own_left, challenger, target)
+
+            live = (step < bid) & (own_left | others.any(axis=1))
+            depth = remaining[rows, target] - 1
+            revealed[live, step] = self.stacks[g[live], target[live], depth[live]]
+            owner[live, step] = target[live]
+            remaining[rows[live], target[live]] -= 1
+
+        hits = revealed == SKULL
+        failed = hits.any(axis=1)
+        n_revealed = np.where(failed, np.argmax(hits, axis=1) + 1, bid)
+
+        # Revealed cards return to the hand before a failed challenger loses a random card from it
+        own_revealed = (np.arange(n_steps) < n_revealed[:, None]) & (owner == challenger[:, None])
+        hand_skulls = self.skulls[g, challenger] + (own_revealed & hits).sum(axis=1)
+        hand_roses = self.roses[g, challenger] + (own_revealed & (revealed == ROSE)).sum(axis=1)
+        loses_skull = self.rng.random(k) * (hand_skulls + hand_roses) < hand_skulls
+
+        self._retrieve_all(g)
+
+        lost = failed.astype(np.int8)
+        self.skulls[g, challenger] -= lost * loses_skull
+        self.roses[g, challenger] -= lost * ~loses_skull
+
+        won = ~failed
+        self.rounds_won[g[won], challenger[won]] += 1
+        self.rounds[g] += 1
+
+        # Game over on a second round won or when fewer than two players remain
+        self.eliminated[g] |= (self.roses[g] + self.skulls[g]) == 0
+        alive = ~self.eliminated[g]
+        n_alive = alive.sum(axis=1)
+        by_rounds = won & (self.rounds_won[g, challenger] >= 2)
+        by_elimination = ~by_rounds & (n_alive <= 1)
+        self.winner[g[by_rounds]] = challenger[by_rounds]
+        self.winner[g[by_elimination & (n_alive == 1)]] = np.argmax(alive, axis=1)[by_elimination & (n_alive == 1)]
+        self.done[g] = by_rounds | by_elimination
+
+        # Challenger starts the next round, otherwise the first remaining player
+        self.starter[g] = np.where(alive[rows, challenger], challenger, np.argmax(alive, axis=1))
+
+    def run(self) -> Dict:
+        """Play every game to completion and return aggregate results"""
+        while not self.done.all():
+            self._play_round(np.nonzero(~self.done)[0])
+
+        return summarize_results("Batched simulation", self.strategies, self.winner, self.rounds,
+                                 eliminations=int(self.eliminated.sum()), verbose=self.verbose)
+
+def summarize_results(title: str, strategies: List[str], winners: np.ndarray, rounds: np.ndarray,
+                      eliminations: Optional[int] = None, verbose: bool = False) -> Dict:
+    """Aggregate per-game winners (-1 for none) and round counts into a results dict"""
+    n_games = winners.size
+    wins_by_seat = np.bincount(winners[winners >= 0], minlength=len(strategies))
+    results = {
+        'games': n_games,
+        'wins_by_seat': wins_by_seat.tolist(),
+        'wins_by_strategy': {},
+        'no_winner': int((winners < 0).sum()),
+        'mean_rounds': float(rounds.mean()) if n_games else 0.0
+    }
+    if eliminations is not None:
+        results['eliminations'] = eliminations
+    for seat, strategy in enumerate(strategies):
+        results['wins_by_strategy'][strategy] = results['wins_by_strategy'].get(strategy, 0) + int(wins_by_seat[seat])
+
+    if verbose:
+        print(f"\n📊 {title}: {n_games} games, {len(strategies)} players")
+        print(f"  • Average rounds per game: {results['mean_rounds']:.2f}")
+        if eliminations is not None:
+            print(f"  • Players eliminated: {eliminations}")
+        for seat, strategy in enumerate(strategies):
+            print(f"  🤖 Seat {seat + 1} ({strategy}): {wins_by_seat[seat]} wins ({wins_by_seat[seat] / max(n_games, 1):.1%})")
+
+    return results
+
+def simulate_batch(n_games: int, n_players: int, strategies: Optional[List[str]] = None,
+                   seed: Optional[int] = None, verbose: bool = False) -> Dict:
+    """Simulate n_games AI-only games at once and return aggregate results"""
+    return BatchedSkullSim(n_games, n_players, strategies, seed=seed, verbose=verbose).run()
+
+# Example usage
+if __name__ == "__main__":
+    simulate_batch(10000, 4, ["balanced", "aggressive", "conservative", "balanced"], verbose=True)
@@ -0,0 +1,247 @@
+"""
+Skull and Roses - Compiled Single-Game Rollouts
+
+Self-play for AI-only games with the round loop compiled to native code by Numba.
+A round is a pure function over small fixed-size int8 arrays (ROSE=0, SKULL=1) and
+a xorshift RNG state, mirroring InteractiveSkullGame's rules and SimpleAIPlayer's
+strategies without any Player or Game objects.
+
+Numba is optional: without it the same functions run as plain Python and produce
+identical results, just slower.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not installed: leave functions uncompiled"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from batched_skull_sim import EMPTY, MAX_CARDS, summarize_results
+from skull_and_roses_game import DEFAULT_STRATEGY_PARAMS, ROSE, SKULL, STRATEGY_PARAMS
+
+MAX_ROUNDS = 500
+
+# Column layout of the params array, matching STRATEGY_PARAMS
+SKULL_PROB, BID_BASE, BID_SCALE, RAISE_PROB = 0, 1, 2, 3
+
+@njit(cache=True)
+def _next_random(rng_state):
+    """Advance the xorshift64 state in place and return a float in [0, 1)"""
+    rng_state[0] ^= rng_state[0] >> np.uint64(12)
+    rng_state[0] ^= rng_state[0] << np.uint64(25)
+    rng_state[0] ^= rng_state[0] >> np.uint64(27)
+    return (rng_state[0] >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+@njit(cache=True)
+def _next_seat(seat, blocked):
+    """First seat after the given one (wrapping around) that is not blocked"""
+    n = blocked.shape[0]
+    for i in range(1, n + 1):
+        candidate = (seat + i) % n
+        if not blocked[candidate]:
+            return candidate
+    return seat
+
+@njit(cache=True)
+def _place_card(p, roses, skulls, played_roses, played_skulls, stacks, params, rng_state):
+    """Seat p places one card face-down following its strategy"""
+    if _next_random(rng_state) < params[p, SKULL_PROB] and skulls[p] > 0:
+        card = SKULL
+    elif roses[p] > 0:
+        card = ROSE
+    else:
+        card = SKULL
+
+    stacks[p, played_roses[p] + played_skulls[p]] = card
+    if card == SKULL:
+        skulls[p] -= 1
+        played_skulls[p] += 1
+    else:
+        roses[p] -= 1
+        played_roses[p] += 1
+
+@njit(cache=True)
+def _reveal_top_card(p, roses, skulls, played_roses, played_skulls, stacks):
+    """Flip the top card of seat p's stack back into its hand and return it"""
+    height = played_roses[p] + played_skulls[p] - 1
+    card = stacks[p, height]
+    stacks[p, height] = EMPTY
+    if card == SKULL:
+        played_skulls[p] -= 1
+        skulls[p] += 1
+    else:
+        played_roses[p] -= 1
+        roses[p] += 1
+    return card
+
+@njit(cache=True)
+def _run_round(roses, skulls, played_roses, played_skulls, stacks, eliminated, rounds_won, params, starter, rng_state):
+    """Play one round starting at seat starter. Returns (challenger, challenge_failed)"""
+    n = roses.shape[0]
+
+    # Phase 1: every active player places an initial card
+    for p in range(n):
+        if not eliminated[p]:
+            _place_card(p, roses, skulls, played_roses, played_skulls, stacks, params, rng_state)
+
+    # Phase 2: players add cards until someone starts the bidding
+    current = starter
+    on_table = 0
+    while True:
+        on_table = 0
+        for p in range(n):
+            on_table += played_roses[p] + played_skulls[p]
+        if roses[current] + skulls[current] == 0:
+            break
+        if _next_random(rng_state) < params[current, BID_BASE] + on_table * params[current, BID_SCALE]:
+            break
+        _place_card(current, roses, skulls, played_roses, played_skulls, stacks, params, rng_state)
+        current = _next_seat(current, eliminated)
+
+    # Phase 3: the starter bids 1, then players raise by one or pass
+    bid = 1
+    passed = eliminated.copy()
+    bidders = 0
+    for p in range(n):
+        if not passed[p]:
+            bidders += 1
+    current = _next_seat(current, passed)
+    while bidders > 1:
+        if bid < on_table and _next_random(rng_state) < params[current, RAISE_PROB]:
+            bid += 1
+        else:
+            passed[current] = True
+            bidders -= 1
+        if bidders > 1:
+            current = _next_seat(current, passed)
+    challenger = 0
+    for p in range(n):
+        if not passed[p]:
+            challenger = p
+            break
+
+    # Phase 4: reveal the challenger's own stack first, then random other stacks
+    to_reveal = bid
+    failed = False
+    while to_reveal > 0 and played_roses[challenger] + played_skulls[challenger] > 0:
+        to_reveal -= 1
+        if _reveal_top_card(challenger, roses, skulls, played_roses, played_skulls, stacks) == SKULL:
+            failed = True
+            break
+    while not failed and to_reveal > 0:
+        candidates = 0
+        for p in range(n):
+            if p != challenger and not eliminated[p] and played_roses[p] + played_skulls[p] > 0:
+                candidates += 1
+        if candidates == 0:
+            break
+        pick = int(_next_random(rng_state) * candidates)
+        target = 0
+        for p in range(n):
+            if p != challenger and not eliminated[p] and played_roses[p] + played_skulls[p] > 0:
+                if pick == 0:
+                    target = p
+                    break
+                pick -= 1
+        to_reveal -= 1
+        if _reveal_top_card(target, roses, skulls, played_roses, played_skulls, stacks) == SKULL:
+            failed = True
+
+    # A failed challenger loses a random card from hand
+    if failed:
+        in_hand = roses[challenger] + skulls[challenger]
+        if _next_random(rng_state) * in_hand < skulls[challenger]:
+            skulls[challenger] -= 1
+        else:
+            roses[challenger] -= 1
+
+    # All players retrieve their cards
+    for p in range(n):
+        roses[p] += played_roses[p]
+        skulls[p] += played_skulls[p]
+        played_roses[p] = 0
+        played_skulls[p] = 0
+        for i in range(MAX_CARDS):
+            stacks[p, i] = EMPTY
+
+    if failed:
+        if roses[challenger] + skulls[challenger] == 0:
+            eliminated[challenger] = True
+    else:
+        rounds_won[challenger] += 1
+
+    return challenger, failed
+
+@njit(cache=True)
+def _run_game(params, starter, rng_state):
+    """Play one game to completion. Returns (winner seat or -1, rounds played)"""
+    n = params.shape[0]
+    roses = np.full(n, 3, dtype=np.int8)
+    skulls = np.ones(n, dtype=np.int8)
+    played_roses = np.zeros(n, dtype=np.int8)
+    played_skulls = np.zeros(n, dtype=np.int8)
+    stacks = np.full((n, MAX_CARDS), EMPTY, dtype=np.int8)
+    eliminated = np.zeros(n, dtype=np.bool_)
+    rounds_won = np.zeros(n, dtype=np.int8)
+
+    for round_number in range(1, MAX_ROUNDS + 1):
+        challenger, failed = _run_round(roses, skulls, played_roses, played_skulls, stacks,
+                                        eliminated, rounds_won, params, starter, rng_state)
+        if not failed and rounds_won[challenger] >= 2:
+            return challenger, round_number
+
+        alive = 0
+        first_alive = -1
+        for p in range(n):
+            if not eliminated[p]:
+                alive += 1
+                if first_alive < 0:
+                    first_alive = p
+        if alive <= 1:
+            return first_alive, round_number
+
+        # Challenger starts the next round, otherwise the first remaining player
+        starter = first_alive if eliminated[challenger] else challenger
+
+    return -1, MAX_ROUNDS
+
+@njit(cache=True)
+def _run_games(params, n_games, rng_state):
+    """Play n_games games. Returns (winner per game, rounds per game)"""
+    n = params.shape[0]
+    winners = np.empty(n_games, dtype=np.int64)
+    rounds = np.empty(n_games, dtype=np.int64)
+    for g in range(n_games):
+        starter = int(_next_random(rng_state) * n)
+        winners[g], rounds[g] = _run_game(params, starter, rng_state)
+    return winners, rounds
+
+def _make_rng_state(seed: Optional[int]) -> np.ndarray:
+    """Seed the xorshift state (which must never be zero) from an int or OS entropy"""
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    state = (seed * 0x9E3779B97F4A7C15 + 0x632BE59BD9B4E019) % (1 << 64)
+    return np.array([state or 1], dtype=np.uint64)
+
+def _strategy_params(strategies: List[str]) -> np.ndarray:
+    """Resolve strategy names to an (n_players, 4) float array, defaulting to balanced"""
+    if len(strategies) < 2 or len(strategies) > 6:
+        raise ValueError("Game requires 2-6 players")
+    return np.array([STRATEGY_PARAMS.get(s, DEFAULT_STRATEGY_PARAMS) for s in strategies], dtype=np.float64)
+
+def simulate_games(strategies: List[str], n_games: int, seed: Optional[int] = None, verbose: bool = False) -> Dict:
+    """Play n_games AI-only games one after another with the compiled rollout"""
+    winners, rounds = _run_games(_strategy_params(strategies), n_games, _make_rng_state(seed))
+
+    return summarize_results("Compiled rollouts", strategies, winners, rounds, verbose=verbose)
+
+# Example usage
+if __name__ == "__main__":
+    simulate_games(["balanced", "aggressive", "conservative", "balanced"], 100000, verbose=True)
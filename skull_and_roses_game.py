@@ -16,28 +16,22 @@ Features:
 - Enhanced user interface with emojis and clear prompts
 """
 
+import array
 import random
+from types import MappingProxyType
 from enum import Enum
-from typing import List, Optional, Tuple, Dict
-import copy
+from collections import deque, namedtuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 def wait_for_human_conformation(text):
     # input(text)
     print(text)
 
-class CardType(Enum):
-    ROSE = "Rose"
-    SKULL = "Skull"
-
-class Card:
-    def __init__(self, card_type: CardType):
-        self.card_type = card_type
-
-    def __str__(self):
-        return self.card_type.value
-
-    def __repr__(self):
-        return f"Card({self.card_type.value})"
+# Card codes, with their display names indexed by code
+ROSE = 0
+SKULL = 1
+_CARD_NAME = ("Rose", "Skull")
 
 class GameState(Enum):
     INITIAL_PLACEMENT = "initial_placement"
@@ -46,16 +40,30 @@ class GameState(Enum):
     CHALLENGE = "challenge"
     GAME_OVER = "game_over"
 
+# Snapshot of the game from one player's point of view, built once per decision
+GameInfoView = namedtuple('GameInfoView', 'cards_in_hand has_skull roses_in_hand cards_played total_cards_on_table active_players current_bid rounds_won game')
+
 class Player:
     """Base player class with core game mechanics"""
 
+    verbosity_prefix = ""  # Shown before the player's name when announcing moves
+    icon = "🤖"  # Shown next to the player's name in state displays
+    kind = "AI"  # Player type shown in the players list
+
     def __init__(self, name: str, is_ai: bool = False):
         self.name = name
         self.is_ai = is_ai
-        self.hand = [Card(CardType.ROSE), Card(CardType.ROSE), Card(CardType.ROSE), Card(CardType.SKULL)]
-        self.played_cards = []  # Stack of face-down cards
+        self.is_human = False
+        self.rng = random.Random()  # Replaced by the game's RNG once seated
+        self._seat = 0  # Index in the game's player list, set once seated
+        # Cards are only ever distinguished by type, so the hand is kept as counters
+        self.roses = 3
+        self.skulls = 1
+        self.played_roses = 0
+        self.played_skulls = 0
+        self.card_count = 4  # Cards still owned, in hand or on the table
+        self.played_cards = array.array('b')  # Stack of face-down ROSE/SKULL codes, kept for reveal order
         self.rounds_won = 0
-        self.is_eliminated = False
         self.has_passed = False
 
         # Statistics tracking
@@ -67,138 +75,197 @@ class Player:
             'roses_played': 0
         }
 
-    def add_card_to_hand(self, card: Card):
-        self.hand.append(card)
+    def add_card_to_hand(self, is_skull: bool):
+        if is_skull:
+            self.skulls += 1
+        else:
+            self.roses += 1
+        self.card_count += 1
 
-    def play_card(self, card: Card):
+    def play_card(self, is_skull: bool):
         """Play a card face-down to the player's stack"""
-        if card in self.hand:
-            self.hand.remove(card)
-            self.played_cards.append(card)
+        if is_skull:
+            if self.skulls == 0:
+                return False
+            self.skulls -= 1
+            self.played_skulls += 1
+            self.stats['skulls_played'] += 1
+        else:
+            if self.roses == 0:
+                return False
+            self.roses -= 1
+            self.played_roses += 1
+            self.stats['roses_played'] += 1
+        self.played_cards.append(SKULL if is_skull else ROSE)
+        return True
 
-            # Update stats
-            if card.card_type == CardType.SKULL:
-                self.stats['skulls_played'] += 1
-            else:
-                self.stats['roses_played'] += 1
-            return True
-        return False
+    def reveal_top_card(self) -> bool:
+        """Flip the top card of the stack back into the hand. Returns True for a skull"""
+        is_skull = self.played_cards.pop() == SKULL
+        if is_skull:
+            self.played_skulls -= 1
+            self.skulls += 1
+        else:
+            self.played_roses -= 1
+            self.roses += 1
+        return is_skull
 
     def retrieve_cards(self):
         """Retrieve all played cards back to hand"""
-        self.hand.extend(self.played_cards)
-        self.played_cards = []
-
-    def lose_random_card(self) -> Card:
-        """Lose a random card permanently"""
-        if self.hand:
-            card = random.choice(self.hand)
-            self.hand.remove(card)
-            self.stats['cards_lost'] += 1
-            if len(self.hand) == 0:
-                self.is_eliminated = True
-            return card
+        self.roses += self.played_roses
+        self.skulls += self.played_skulls
+        self.played_roses = self.played_skulls = 0
+        del self.played_cards[:]
+
+    def lose_random_card(self) -> Optional[bool]:
+        """Lose a random card permanently. Returns True if the lost card was a skull"""
+        if self.roses or self.skulls:
+            is_skull = self.rng.random() < self.skulls / (self.skulls + self.roses)
+            return self.lose_chosen_card(is_skull)
         return None
 
-    def lose_chosen_card(self, card: Card):
+    def lose_chosen_card(self, is_skull: bool) -> Optional[bool]:
         """Lose a specific card (when player reveals own skull)"""
-        if card in self.hand:
-            self.hand.remove(card)
-            self.stats['cards_lost'] += 1
-            if len(self.hand) == 0:
-                self.is_eliminated = True
-            return card
-        return None
+        if is_skull:
+            if self.skulls == 0:
+                return None
+            self.skulls -= 1
+        else:
+            if self.roses == 0:
+                return None
+            self.roses -= 1
+        self.card_count -= 1
+        self.stats['cards_lost'] += 1
+        return is_skull
+
+    @property
+    def is_eliminated(self) -> bool:
+        """Out of the game once no cards are left in hand or on the table"""
+        return self.card_count == 0
+
+    def cards_in_hand(self) -> int:
+        return self.roses + self.skulls
 
     def has_cards_to_play(self) -> bool:
-        return len(self.hand) > 0
+        return self.roses + self.skulls > 0
 
     def cards_played_count(self) -> int:
-        return len(self.played_cards)
+        return self.played_roses + self.played_skulls
 
     def has_skull_in_hand(self) -> bool:
-        return any(card.card_type == CardType.SKULL for card in self.hand)
+        return self.skulls > 0
 
     def count_roses_in_hand(self) -> int:
-        return sum(1 for card in self.hand if card.card_type == CardType.ROSE)
+        return self.roses
 
     def reset_for_new_round(self):
         """Reset player state for new round"""
         self.has_passed = False
 
-    def get_game_state_info(self, game) -> Dict:
+    def choose_card_to_play(self, game_info: GameInfoView = None) -> Optional[bool]:
+        """Fallback: play a random card from hand"""
+        if not self.has_cards_to_play():
+            return None
+        return self.rng.random() < self.skulls / (self.skulls + self.roses)
+
+    def decide_play_or_bid(self, game_info: GameInfoView) -> bool:
+        """Fallback: start bidding with a fixed probability"""
+        return self.rng.random() < 0.3
+
+    def make_bid(self, current_bid: int, max_possible: int, game_info: GameInfoView = None) -> Optional[int]:
+        """Fallback: raise by one with a fixed probability, otherwise pass"""
+        if self.rng.random() < 0.4 and current_bid < max_possible:
+            return current_bid + 1
+        return None
+
+    def announce_play(self, action: str):
+        """Tell the table what this player just did"""
+        print(f"{self.verbosity_prefix}{self.name} {action}")
+
+    def get_game_state_info(self, game) -> GameInfoView:
         """Get information about current game state for decision making"""
-        return {
-            'cards_in_hand': len(self.hand),
-            'has_skull': self.has_skull_in_hand(),
-            'roses_in_hand': self.count_roses_in_hand(),
-            'cards_played': len(self.played_cards),
-            'total_cards_on_table': game.total_cards_on_table(),
-            'active_players': len(game.get_active_players()),
-            'current_bid': game.current_bid,
-            'rounds_won': self.rounds_won
-        }
+        return GameInfoView(
+            self.roses + self.skulls,
+            self.skulls > 0,
+            self.roses,
+            self.played_roses + self.played_skulls,
+            game.total_cards_on_table(),
+            len(game.get_active_players()),
+            game.current_bid,
+            self.rounds_won,
+            game
+        )
 
     def __str__(self):
-        return f"{self.name} - Cards in hand: {len(self.hand)}, Played: {len(self.played_cards)}, Wins: {self.rounds_won}"
+        return f"{self.name} - Cards in hand: {self.cards_in_hand()}, Played: {self.cards_played_count()}, Wins: {self.rounds_won}"
 
 class InteractiveHumanPlayer(Player):
     """Truly interactive human player with real user input"""
 
+    icon = "👤"
+    kind = "Human"
+
     def __init__(self, name: str):
         super().__init__(name, is_ai=False)
+        self.is_human = True
+
+    def announce_play(self, action: str):
+        """The human already saw their own choice at the prompt"""
+        pass
 
     def display_hand(self):
         """Display the player's current hand"""
-        print(f"\n{self.name}'s hand:")
-        roses = [i for i, card in enumerate(self.hand) if card.card_type == CardType.ROSE]
-        skulls = [i for i, card in enumerate(self.hand) if card.card_type == CardType.SKULL]
+        print(f"\n{self.name}'s hand:\n  🌹 Roses: {self.roses}\n  💀 Skulls: {self.skulls}")
 
-        for i, card in enumerate(self.hand):
-            card_type = "🌹 Rose" if card.card_type == CardType.ROSE else "💀 Skull"
-            print(f"  {i+1}. {card_type}")
+    def _prompt_card_type(self, action: str) -> Optional[bool]:
+        """Ask for a card type. Returns True for skull, False for rose, None if the player quit"""
+        while True:
+            choice = input(f"\nChoose a card to {action} (R)ose or (S)kull: ").strip().lower()
+            if choice in ['q', 'quit']:
+                print("Game quit by player.")
+                return None
 
-    def choose_card_to_play(self, game_info: Dict = None) -> Card:
+            if choice in ['r', 'rose']:
+                is_skull = False
+            elif choice in ['s', 'skull']:
+                is_skull = True
+            else:
+                print("Please enter 'R' for a rose or 'S' for a skull.")
+                continue
+
+            if (self.skulls if is_skull else self.roses) == 0:
+                print(f"You have no {_CARD_NAME[is_skull].lower()}s in hand.")
+                continue
+
+            print(f"You chose to {action}: {_CARD_NAME[is_skull]}")
+            return is_skull
+
+    def choose_card_to_play(self, game_info: GameInfoView = None) -> Optional[bool]:
         """Interactive card selection for human players"""
-        if not self.hand:
+        if not self.has_cards_to_play():
             return None
 
         print(f"\n--- {self.name}'s Turn to Play a Card ---")
 
         # Show game context
         if game_info:
-            print(f"Cards on table: {game_info['total_cards_on_table']}")
-            print(f"Active players: {game_info['active_players']}")
+            print(f"Cards on table: {game_info.total_cards_on_table}")
+            print(f"Active players: {game_info.active_players}")
 
         self.display_hand()
 
-        while True:
-            try:
-                choice = input(f"\nChoose a card to play (1-{len(self.hand)}): ").strip()
-                if choice.lower() in ['q', 'quit']:
-                    print("Game quit by player.")
-                    return None
-
-                card_index = int(choice) - 1
-                if 0 <= card_index < len(self.hand):
-                    selected_card = self.hand[card_index]
-                    card_name = "Rose" if selected_card.card_type == CardType.ROSE else "Skull"
-                    print(f"You chose to play: {card_name}")
-                    return selected_card
-                else:
-                    print(f"Invalid choice. Please enter a number between 1 and {len(self.hand)}")
-            except ValueError:
-                print("Please enter a valid number.")
-            except KeyboardInterrupt:
-                print("\nGame interrupted by player.")
-                return None
+        try:
+            return self._prompt_card_type("play")
+        except KeyboardInterrupt:
+            print("\nGame interrupted by player.")
+            return None
 
-    def decide_play_or_bid(self, game_info: Dict) -> bool:
+    def decide_play_or_bid(self, game_info: GameInfoView) -> bool:
         """Interactive decision to play another card or start bidding"""
         print(f"\n--- {self.name}'s Turn Decision ---")
-        print(f"You have {game_info['cards_in_hand']} cards remaining in hand")
-        print(f"Total cards on table: {game_info['total_cards_on_table']}")
-        print(f"You have played {game_info['cards_played']} cards")
+        print(f"You have {game_info.cards_in_hand} cards remaining in hand")
+        print(f"Total cards on table: {game_info.total_cards_on_table}")
+        print(f"You have played {game_info.cards_played} cards")
 
         while True:
             choice = input("\nDo you want to (P)lay another card or (B)id? [P/B]: ").strip().upper()
@@ -212,14 +279,14 @@ class InteractiveHumanPlayer(Player):
             else:
                 print("Please enter 'P' to play another card or 'B' to bid.")
 
-    def make_bid(self, current_bid: int, max_possible: int, game_info: Dict = None) -> Optional[int]:
+    def make_bid(self, current_bid: int, max_possible: int, game_info: GameInfoView = None) -> Optional[int]:
         """Interactive bidding for human players"""
         print(f"\n--- {self.name}'s Bidding Turn ---")
         print(f"Current bid: {current_bid}")
         print(f"Maximum possible bid: {max_possible}")
 
         if game_info:
-            print(f"You have {game_info['roses_in_hand']} roses and {'a skull' if game_info['has_skull'] else 'no skull'} in hand")
+            print(f"You have {game_info.roses_in_hand} roses and {'a skull' if game_info.has_skull else 'no skull'} in hand")
 
         while True:
             try:
@@ -244,9 +311,9 @@ class InteractiveHumanPlayer(Player):
                 print("\nGame interrupted by player.")
                 return None
 
-    def choose_card_to_lose(self) -> Card:
+    def choose_card_to_lose(self) -> Optional[bool]:
         """Interactive card selection when losing a card"""
-        if not self.hand:
+        if not self.has_cards_to_play():
             return None
 
         print(f"\n--- {self.name} Must Lose a Card ---")
@@ -254,91 +321,176 @@ class InteractiveHumanPlayer(Player):
 
         self.display_hand()
 
-        while True:
-            try:
-                choice = input(f"\nChoose a card to lose (1-{len(self.hand)}): ").strip()
-                if choice.lower() in ['q', 'quit']:
-                    print("Game quit by player.")
-                    return random.choice(self.hand)  # Fallback
-
-                card_index = int(choice) - 1
-                if 0 <= card_index < len(self.hand):
-                    selected_card = self.hand[card_index]
-                    card_name = "Rose" if selected_card.card_type == CardType.ROSE else "Skull"
-                    print(f"You chose to lose: {card_name}")
-                    return selected_card
-                else:
-                    print(f"Invalid choice. Please enter a number between 1 and {len(self.hand)}")
-            except ValueError:
-                print("Please enter a valid number.")
-            except KeyboardInterrupt:
-                print("\nGame interrupted by player.")
-                return random.choice(self.hand)  # Fallback
+        try:
+            is_skull = self._prompt_card_type("lose")
+        except KeyboardInterrupt:
+            print("\nGame interrupted by player.")
+            is_skull = None
+        if is_skull is None:
+            # Fallback
+            is_skull = self.rng.random() < self.skulls / (self.skulls + self.roses)
+        return is_skull
+
+# Per-strategy AI parameters: (skull_prob, bid_base, bid_scale, raise_prob)
+STRATEGY_PARAMS = MappingProxyType({
+    "aggressive": (0.4, 0.4, 0.05, 0.5),
+    "conservative": (0.2, 0.2, 0.03, 0.3),
+    "balanced": (0.3, 0.3, 0.04, 0.4),
+})
+DEFAULT_STRATEGY_PARAMS = STRATEGY_PARAMS["balanced"]
 
 class SimpleAIPlayer(Player):
     """Simple AI player for testing with human players"""
 
+    verbosity_prefix = "🤖 "
+
     def __init__(self, name: str, strategy: str = "balanced"):
         super().__init__(name, is_ai=True)
         self.strategy = strategy
 
-    def choose_card_to_play(self, game_info: Dict = None) -> Card:
+        # Resolve the strategy once instead of on every decision
+        params = STRATEGY_PARAMS.get(strategy, DEFAULT_STRATEGY_PARAMS)
+        self._skull_prob, self._bid_base, self._bid_scale, self._raise_prob = params
+
+    def choose_card_to_play(self, game_info: GameInfoView = None) -> Optional[bool]:
         """AI chooses which card to play"""
-        if not self.hand:
+        if not self.has_cards_to_play():
             return None
 
-        skulls = [card for card in self.hand if card.card_type == CardType.SKULL]
-        roses = [card for card in self.hand if card.card_type == CardType.ROSE]
-
-        # Strategy-based decision
-        if self.strategy == "aggressive":
-            skull_prob = 0.4
-        elif self.strategy == "conservative":
-            skull_prob = 0.2
-        else:  # balanced
-            skull_prob = 0.3
-
-        if random.random() < skull_prob and skulls:
-            return random.choice(skulls)
-        elif roses:
-            return random.choice(roses)
-        else:
-            return random.choice(self.hand)
+        if self.rng.random() < self._skull_prob and self.skulls:
+            return True
+        return self.roses == 0
 
-    def decide_play_or_bid(self, game_info: Dict) -> bool:
+    def decide_play_or_bid(self, game_info: GameInfoView) -> bool:
         """AI decides whether to play another card or start bidding"""
-        total_cards = game_info.get('total_cards_on_table', 0)
+        total_cards = game_info.total_cards_on_table
         # Strategy affects bidding eagerness
-        if self.strategy == "aggressive":
-            bid_probability = 0.4 + (total_cards * 0.05)
-        elif self.strategy == "conservative":
-            bid_probability = 0.2 + (total_cards * 0.03)
-        else:  # balanced
-            bid_probability = 0.3 + (total_cards * 0.04)
-
-        return random.random() < bid_probability
+        return self.rng.random() < self._bid_base + total_cards * self._bid_scale
 
-    def make_bid(self, current_bid: int, max_possible: int, game_info: Dict = None) -> Optional[int]:
+    def make_bid(self, current_bid: int, max_possible: int, game_info: GameInfoView = None) -> Optional[int]:
         """AI makes a bid or returns None to pass"""
         if current_bid >= max_possible:
             return None
 
         # Strategy affects bidding aggressiveness
-        if self.strategy == "aggressive":
-            raise_prob = 0.5
-        elif self.strategy == "conservative":
-            raise_prob = 0.3
-        else:  # balanced
-            raise_prob = 0.4
-
-        if random.random() < raise_prob:
+        if self.rng.random() < self._raise_prob:
             return min(current_bid + 1, max_possible)
         return None
 
+# Cost of losing a card, in rounds won, for MinimaxAIPlayer's leaf evaluation
+CARD_LOSS_VALUE = 0.5
+
+@lru_cache(maxsize=65536)
+def _reveal_success(needed: int, revealed: Tuple[int, ...], rose_odds: Tuple[Tuple[float, ...], ...]) -> float:
+    """Probability that revealing `needed` more cards from randomly chosen stacks finds only roses.
+
+    rose_odds[i][k] is the probability that the top k cards of stack i are all roses and
+    revealed[i] is how many of those are already face-up. Every reveal sequence is enumerated,
+    pruning as soon as a stack is certain to have shown a skull.
+    """
+    for k, odds in zip(revealed, rose_odds):
+        if odds[k] == 0.0:
+            return 0.0
+
+    open_stacks = [i for i, odds in enumerate(rose_odds) if revealed[i] < len(odds) - 1]
+    if needed == 0 or not open_stacks:
+        probability = 1.0
+        for k, odds in zip(revealed, rose_odds):
+            probability *= odds[k]
+        return probability
+
+    total = 0.0
+    for i in open_stacks:
+        total += _reveal_success(needed - 1, revealed[:i] + (revealed[i] + 1,) + revealed[i + 1:], rose_odds)
+    return total / len(open_stacks)
+
+class MinimaxAIPlayer(SimpleAIPlayer):
+    """AI player that plays the endgame bidding with an alpha-beta minimax search"""
+
+    def __init__(self, name: str, strategy: str = "balanced", depth: int = 6, endgame_cards: int = 8):
+        super().__init__(name, strategy)
+        self.depth = depth  # Search depth in plies (one raise or pass each)
+        self.endgame_cards = endgame_cards  # Search once this few cards are on the table
+
+    def _own_odds(self) -> Tuple[float, ...]:
+        """Own stack is known: the top k cards are roses unless a skull is among them"""
+        odds = [1.0]
+        for card in reversed(self.played_cards):
+            odds.append(0.0 if card == SKULL else odds[-1])
+        return tuple(odds)
+
+    @staticmethod
+    def _hidden_odds(player: Player) -> Tuple[float, ...]:
+        """Other stacks are hidden: assume one skull, equally likely to be any of the player's cards"""
+        return tuple(1.0 - k / player.card_count for k in range(player.cards_played_count() + 1))
+
+    @staticmethod
+    def _challenge_value(own_odds: Tuple[float, ...], other_odds: Tuple[Tuple[float, ...], ...], bid: int) -> float:
+        """Expected rounds-won delta for a challenger who reveals their own stack first"""
+        own = min(bid, len(own_odds) - 1)
+        probability = own_odds[own]
+        if probability > 0.0 and bid > own:
+            probability *= _reveal_success(bid - own, (0,) * len(other_odds), other_odds)
+        return probability - (1.0 - probability) * CARD_LOSS_VALUE
+
+    def _leaf_values(self, game, max_bid: int) -> Tuple[List[float], List[float]]:
+        """Value of every final bid with this player as challenger, and with an opponent as challenger"""
+        opponents = [p for p in game.get_active_players() if p is not self]
+        own_odds = self._own_odds()
+        hidden = [self._hidden_odds(p) for p in opponents]
+        bidders = [i for i, p in enumerate(opponents) if not p.has_passed]
+
+        as_challenger = [self._challenge_value(own_odds, tuple(hidden), bid) for bid in range(max_bid + 1)]
+        as_defender = [0.0] * (max_bid + 1)
+        for i in bidders:
+            # An opponent won't bid past a skull of their own, so their own stack counts as safe
+            safe = (1.0,) * (opponents[i].cards_played_count() + 1)
+            others = tuple(hidden[:i] + hidden[i + 1:]) + (own_odds,)
+            for bid in range(max_bid + 1):
+                as_defender[bid] -= self._challenge_value(safe, others, bid) / len(bidders)
+        return as_challenger, as_defender
+
+    def _alphabeta(self, bid: int, max_bid: int, my_turn: bool, depth: int, alpha: float, beta: float, values) -> float:
+        """Minimax value of the bidding at `bid`, with the rest of the table as one minimizing side"""
+        as_challenger, as_defender = values
+        if my_turn:
+            # Passing hands the challenge at the current bid to an opponent
+            best = as_defender[bid]
+            if depth > 0 and bid < max_bid and best < beta:
+                best = max(best, self._alphabeta(bid + 1, max_bid, False, depth - 1, max(alpha, best), beta, values))
+            return best
+
+        # Opponents passing leaves this player to challenge at the current bid
+        best = as_challenger[bid]
+        if depth > 0 and bid < max_bid and best > alpha:
+            best = min(best, self._alphabeta(bid + 1, max_bid, True, depth - 1, alpha, min(beta, best), values))
+        return best
+
+    def decide_play_or_bid(self, game_info: GameInfoView) -> bool:
+        """Open the bidding in the endgame only if the search says it pays off"""
+        if game_info.total_cards_on_table > self.endgame_cards:
+            return super().decide_play_or_bid(game_info)
+
+        max_bid = game_info.total_cards_on_table
+        values = self._leaf_values(game_info.game, max_bid)
+        return self._alphabeta(1, max_bid, False, self.depth, float('-inf'), float('inf'), values) > 0.0
+
+    def make_bid(self, current_bid: int, max_possible: int, game_info: GameInfoView = None) -> Optional[int]:
+        """Raise in the endgame only if the search values it above passing"""
+        if current_bid >= max_possible:
+            return None
+        if game_info is None or game_info.total_cards_on_table > self.endgame_cards:
+            return super().make_bid(current_bid, max_possible, game_info)
+
+        values = self._leaf_values(game_info.game, max_possible)
+        pass_value = values[1][current_bid]
+        raise_value = self._alphabeta(current_bid + 1, max_possible, False, self.depth - 1, pass_value, float('inf'), values)
+        return current_bid + 1 if raise_value > pass_value else None
+
 class InteractiveSkullGame:
     """Enhanced Skull game controller that supports interactive human players"""
 
-    def __init__(self, players: List[Player], verbose: bool = True):
+    def __init__(self, players: List[Player], verbose: bool = True, fast_mode: bool = False, seed: Optional[int] = None):
         if len(players) < 2 or len(players) > 6:
             raise ValueError("Game requires 2-6 players")
 
@@ -349,8 +501,21 @@ class InteractiveSkullGame:
         self.challenger = None
         self.skull_revealer = None
         self.round_number = 1
-        self.game_log = []
+        self.game_log = deque(maxlen=256)  # Most recent printed log entries
         self.verbose = verbose
+        self.fast_mode = fast_mode  # Skip all table output and confirmation prompts (AI-only games)
+        self.rng = random.Random(seed)  # Per-game RNG so seeded games are reproducible and independent
+        # Cached table card count, recomputed only after a card moves on/off the table
+        self._table_cache = 0
+        self._table_dirty = True
+        self._active_bidders = 0  # Players still in the bidding this round
+        self._winner = None  # Set when a player wins two rounds or outlasts everyone else
+        self._phase_dispatch = {
+            GameState.INITIAL_PLACEMENT: self.initial_card_placement,
+            GameState.CARD_PLACEMENT: self.card_placement_phase,
+            GameState.BIDDING: self.bidding_phase,
+            GameState.CHALLENGE: self.challenge_phase
+        }
         self.game_stats = {
             'total_rounds': 0,
             'total_challenges': 0,
@@ -359,17 +524,35 @@ class InteractiveSkullGame:
         }
 
         # Shuffle initial player order
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
+        for seat, player in enumerate(self.players):
+            player.rng = self.rng
+            player._seat = seat
+        self.active_players = list(self.players)  # Updated only when a player is eliminated
+        self._update_seating()
 
     def log(self, message: str, force_print: bool = False):
-        """Add message to game log with optional printing"""
+        """Print and keep a log entry if verbose or force_print is set; fast mode logs nothing"""
+        if self.fast_mode or not (force_print or self.verbose):
+            return
         log_entry = f"Round {self.round_number}: {message}"
         self.game_log.append(log_entry)
-        if self.verbose or force_print:
-            print(log_entry)
+        print(log_entry)
+
+    def _say(self, message: str):
+        """Print a message to the table unless running in fast mode"""
+        if not self.fast_mode:
+            print(message)
+
+    def _announce(self, player: Player, action: str):
+        """Let a player announce their move unless running in fast mode"""
+        if not self.fast_mode:
+            player.announce_play(action)
 
     def display_game_state(self):
         """Display current game state for human players"""
+        if self.fast_mode:
+            return
         print(f"\n{'='*60}")
         print(f"ROUND {self.round_number} - {self.game_state.value.replace('_', ' ').title()}")
         print(f"{'='*60}")
@@ -378,44 +561,57 @@ class InteractiveSkullGame:
         print(f"Active Players: {len(active_players)}")
 
         for player in active_players:
-            status_icon = "👤" if isinstance(player, InteractiveHumanPlayer) else "🤖"
-            cards_display = f"Hand: {len(player.hand)} cards, Played: {len(player.played_cards)} cards"
+            status_icon = player.icon
+            cards_display = f"Hand: {player.cards_in_hand()} cards, Played: {player.cards_played_count()} cards"
             wins_display = f"Rounds won: {player.rounds_won}"
             print(f"  {status_icon} {player.name}: {cards_display}, {wins_display}")
 
-        if self.game_state == GameState.BIDDING and self.current_bid > 0:
+        if self.game_state is GameState.BIDDING and self.current_bid > 0:
             print(f"\nCurrent bid: {self.current_bid}")
             print(f"Total cards on table: {self.total_cards_on_table()}")
 
         print()
 
+    def wait_for_confirmation(self, text: str):
+        """Pause for the human player unless running in fast mode"""
+        if not self.fast_mode:
+            wait_for_human_conformation(text)
+
     def get_current_player(self) -> Player:
         return self.players[self.current_player_index]
 
     def get_active_players(self) -> List[Player]:
         """Get players who are not eliminated"""
-        return [p for p in self.players if not p.is_eliminated]
+        return self.active_players
+
+    def _update_seating(self):
+        """Precompute the next active seat after every seat (call after an elimination)"""
+        n = len(self.players)
+        self._next_seat = []
+        for seat in range(n):
+            following = seat
+            for step in range(1, n + 1):
+                if not self.players[(seat + step) % n].is_eliminated:
+                    following = (seat + step) % n
+                    break
+            self._next_seat.append(following)
 
     def next_player(self):
         """Move to next active player"""
-        attempts = 0
-        while True:
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            if not self.players[self.current_player_index].is_eliminated:
-                break
-            attempts += 1
-            if attempts >= len(self.players):
-                break
+        self.current_player_index = self._next_seat[self.current_player_index]
 
     def total_cards_on_table(self) -> int:
         """Count total cards played by all players"""
-        return sum(len(p.played_cards) for p in self.players if not p.is_eliminated)
+        if self._table_dirty:
+            self._table_cache = sum(p.cards_played_count() for p in self.get_active_players())
+            self._table_dirty = False
+        return self._table_cache
 
     def initial_card_placement(self):
         """Phase 1: All players place their initial card"""
         self.display_game_state()
         self.log("=== Initial Card Placement Phase ===")
-        print("All players must place one card face-down to start the round.\n")
+        self._say("All players must place one card face-down to start the round.\n")
 
         active_players = self.get_active_players()
 
@@ -425,50 +621,33 @@ class InteractiveSkullGame:
             return
 
         for player in active_players:
-            if not player.has_cards_to_play():
-                self.log(f"{player.name} has no cards and is eliminated!")
-                player.is_eliminated = True
-                continue
-
             # Get game info for decision making
             game_info = player.get_game_state_info(self)
 
-            if isinstance(player, InteractiveHumanPlayer):
-                card = player.choose_card_to_play(game_info)
-                if card is None:  # Player quit
-                    self.game_state = GameState.GAME_OVER
-                    return
-            elif player.is_ai:
-                card = player.choose_card_to_play(game_info)
-                print(f"🤖 {player.name} placed a card face-down")
-            else:
-                card = random.choice(player.hand) if player.hand else None
-                print(f"{player.name} placed a card face-down")
-
-            if card:
-                player.play_card(card)
-                self.log(f"{player.name} placed a card face-down")
+            is_skull = player.choose_card_to_play(game_info)
+            if is_skull is None:  # Player quit
+                self.game_state = GameState.GAME_OVER
+                return
 
-        remaining_players = self.get_active_players()
-        if len(remaining_players) < 2:
-            self.log("Not enough players remaining to continue")
-            self.game_state = GameState.GAME_OVER
-            return
+            self._announce(player, "placed a card face-down")
+            player.play_card(is_skull)
+            self._table_dirty = True
+            self.log(f"{player.name} placed a card face-down")
 
         self.game_state = GameState.CARD_PLACEMENT
         self.log("All active players have placed their initial cards")
-        print("\nInitial placement complete! Moving to card placement phase...\n")
+        self._say("\nInitial placement complete! Moving to card placement phase...\n")
 
     def card_placement_phase(self):
         """Phase 2: Players continue placing cards or start bidding"""
-        if self.game_state != GameState.CARD_PLACEMENT:
+        if self.game_state is not GameState.CARD_PLACEMENT:
             return False
 
         self.display_game_state()
         current_player = self.get_current_player()
 
         if not current_player.has_cards_to_play():
-            print(f"{current_player.name} has no cards left and must start bidding!")
+            self._say(f"{current_player.name} has no cards left and must start bidding!")
             self.start_bidding_phase()
             return True
 
@@ -476,36 +655,20 @@ class InteractiveSkullGame:
         game_info = current_player.get_game_state_info(self)
 
         # Decide whether to play card or bid
-        if isinstance(current_player, InteractiveHumanPlayer):
-            should_bid = current_player.decide_play_or_bid(game_info)
-        elif hasattr(current_player, 'decide_play_or_bid'):
-            should_bid = current_player.decide_play_or_bid(game_info)
-        else:
-            should_bid = random.random() < 0.3  # Simple fallback
-
-        if should_bid:
+        if current_player.decide_play_or_bid(game_info):
             self.start_bidding_phase()
         else:
             # Play another card
-            if isinstance(current_player, InteractiveHumanPlayer):
-                card = current_player.choose_card_to_play(game_info)
-                if card is None:  # Player quit
-                    self.game_state = GameState.GAME_OVER
-                    return False
-            elif hasattr(current_player, 'choose_card_to_play'):
-                card = current_player.choose_card_to_play(game_info)
-                print(f"🤖 {current_player.name} played another card")
-            else:
-                card = random.choice(current_player.hand) if current_player.hand else None
-                print(f"{current_player.name} played another card")
+            is_skull = current_player.choose_card_to_play(game_info)
+            if is_skull is None:  # Player quit
+                self.game_state = GameState.GAME_OVER
+                return False
 
-            if card:
-                current_player.play_card(card)
-                self.log(f"{current_player.name} played another card (now has {current_player.cards_played_count()} cards)")
-                self.next_player()
-            else:
-                self.log(f"{current_player.name} has no cards left and must start bidding")
-                self.start_bidding_phase()
+            self._announce(current_player, "played another card")
+            current_player.play_card(is_skull)
+            self._table_dirty = True
+            self.log(f"{current_player.name} played another card (now has {current_player.cards_played_count()} cards)")
+            self.next_player()
 
         return True
 
@@ -513,9 +676,10 @@ class InteractiveSkullGame:
         """Initialize the bidding phase"""
         self.game_state = GameState.BIDDING
         self.current_bid = 1
+        self._active_bidders = len(self.get_active_players())
         current_player = self.get_current_player()
 
-        print(f"\n🎯 {current_player.name} starts the bidding at {self.current_bid}!")
+        self._say(f"\n🎯 {current_player.name} starts the bidding at {self.current_bid}!")
         self.log(f"=== Bidding Phase Started by {current_player.name} ===")
         self.log(f"Total cards on table: {self.total_cards_on_table()}")
         self.log(f"{current_player.name} bids {self.current_bid}")
@@ -524,7 +688,7 @@ class InteractiveSkullGame:
 
     def bidding_phase(self):
         """Phase 3: Handle bidding until only one player remains"""
-        if self.game_state != GameState.BIDDING:
+        if self.game_state is not GameState.BIDDING:
             return False
 
         self.display_game_state()
@@ -538,39 +702,25 @@ class InteractiveSkullGame:
         game_info = current_player.get_game_state_info(self)
 
         # Make bid decision
-        if isinstance(current_player, InteractiveHumanPlayer):
-            new_bid = current_player.make_bid(self.current_bid, max_possible_bid, game_info)
-        elif hasattr(current_player, 'make_bid'):
-            new_bid = current_player.make_bid(self.current_bid, max_possible_bid, game_info)
-            if new_bid:
-                print(f"🤖 {current_player.name} bids {new_bid}")
-            else:
-                print(f"🤖 {current_player.name} passes")
-        else:
-            # Simple fallback
-            if random.random() < 0.4 and self.current_bid < max_possible_bid:
-                new_bid = self.current_bid + 1
-                print(f"{current_player.name} bids {new_bid}")
-            else:
-                new_bid = None
-                print(f"{current_player.name} passes")
+        new_bid = current_player.make_bid(self.current_bid, max_possible_bid, game_info)
+        self._announce(current_player, f"bids {new_bid}" if new_bid is not None else "passes")
 
         if new_bid is not None:
             self.current_bid = new_bid
             self.log(f"{current_player.name} bids {self.current_bid}")
         else:
             current_player.has_passed = True
+            self._active_bidders -= 1
             self.log(f"{current_player.name} passes")
 
         # Check if only one player hasn't passed
-        active_bidders = [p for p in self.get_active_players() if not p.has_passed]
-        if len(active_bidders) == 1:
-            self.challenger = active_bidders[0]
-            print(f"\n🏆 {self.challenger.name} wins the bidding with {self.current_bid}!")
+        if self._active_bidders == 1:
+            self.challenger = next(p for p in self.get_active_players() if not p.has_passed)
+            self._say(f"\n🏆 {self.challenger.name} wins the bidding with {self.current_bid}!")
             self.log(f"{self.challenger.name} is the challenger with bid of {self.current_bid}")
             self.game_state = GameState.CHALLENGE
             self.game_stats['total_challenges'] += 1
-            wait_for_human_conformation("\nPress Enter to continue to the challenge phase...")
+            self.wait_for_confirmation("\nPress Enter to continue to the challenge phase...")
         else:
             self.next_player()
 
@@ -578,14 +728,14 @@ class InteractiveSkullGame:
 
     def challenge_phase(self):
         """Phase 4: Challenger attempts to reveal the bid number of roses"""
-        if self.game_state != GameState.CHALLENGE:
+        if self.game_state is not GameState.CHALLENGE:
             return False
 
         self.display_game_state()
-        print(f"🎯 CHALLENGE PHASE")
-        print(f"{self.challenger.name} must reveal {self.current_bid} cards without hitting a skull!")
-        print("Cards will be revealed from the challenger's stack first, then from other players.\n")
-        wait_for_human_conformation("Press Enter to start revealing cards...")
+        self._say(f"🎯 CHALLENGE PHASE")
+        self._say(f"{self.challenger.name} must reveal {self.current_bid} cards without hitting a skull!")
+        self._say("Cards will be revealed from the challenger's stack first, then from other players.\n")
+        self.wait_for_confirmation("Press Enter to start revealing cards...")
 
         self.log(f"=== Challenge Phase ===")
         self.log(f"{self.challenger.name} must reveal {self.current_bid} cards")
@@ -594,64 +744,64 @@ class InteractiveSkullGame:
 
         # First, reveal challenger's own cards (mandatory)
         if self.challenger.played_cards:
-            print(f"\nRevealing {self.challenger.name}'s cards first...")
+            self._say(f"\nRevealing {self.challenger.name}'s cards first...")
             while cards_to_reveal > 0 and self.challenger.played_cards:
-                wait_for_human_conformation("Press Enter to reveal next card...")
-                card = self.challenger.played_cards.pop()
-                self.challenger.hand.append(card)
+                self.wait_for_confirmation("Press Enter to reveal next card...")
+                is_skull = self.challenger.reveal_top_card()
+                self._table_dirty = True
                 cards_to_reveal -= 1
-                
-                if len(self.challenger.hand) + len(self.challenger.played_cards) + self.challenger.stats['challenges_lost'] != 4:
-                    raise ValueError(f"{self.name} cannot have more or less than 4 cards total")
 
-                if card.card_type == CardType.SKULL:
-                    print(f"💀 SKULL REVEALED!")
-                    print(f"Challenge failed! {self.challenger.name} hit a skull.")
-                else:
-                    print(f"🌹 ROSE REVEALED!")
+                if __debug__ and not self.fast_mode:
+                    if self.challenger.cards_in_hand() + self.challenger.cards_played_count() != self.challenger.card_count:
+                        raise ValueError(f"{self.challenger.name} holds a different number of cards than card_count")
 
-                self.log(f"Revealed: {card.card_type.value}")
-
-                if card.card_type == CardType.SKULL:
+                if is_skull:
+                    self._say(f"💀 SKULL REVEALED!")
+                    self._say(f"Challenge failed! {self.challenger.name} hit a skull.")
+                    self.log(f"Revealed: {_CARD_NAME[SKULL]}")
                     self.log(f"💀 SKULL REVEALED! Challenge failed!")
                     self.skull_revealer = self.challenger
                     self.challenger.stats['challenges_lost'] += 1
                     self.handle_failed_challenge()
                     return True
 
+                self._say(f"🌹 ROSE REVEALED!")
+                self.log(f"Revealed: {_CARD_NAME[ROSE]}")
+
         # If still need to reveal cards, choose from other players
         other_players = [p for p in self.get_active_players() if p != self.challenger and p.played_cards]
 
         while cards_to_reveal > 0 and other_players:
-            print(f"\nNeed to reveal {cards_to_reveal} more cards from other players...")
-            target_player = random.choice(other_players)
+            self._say(f"\nNeed to reveal {cards_to_reveal} more cards from other players...")
+            target_index = int(self.rng.random() * len(other_players))
+            target_player = other_players[target_index]
 
-            wait_for_human_conformation(f"Press Enter to reveal a card from {target_player.name}...")
-            card = target_player.played_cards.pop()
-            target_player.hand.append(card)
+            self.wait_for_confirmation(f"Press Enter to reveal a card from {target_player.name}...")
+            is_skull = target_player.reveal_top_card()
+            self._table_dirty = True
             cards_to_reveal -= 1
 
-            if card.card_type == CardType.SKULL:
-                print(f"💀 SKULL REVEALED from {target_player.name}!")
-                print(f"Challenge failed!")
-            else:
-                print(f"🌹 ROSE REVEALED from {target_player.name}!")
-
-            self.log(f"Revealed {target_player.name}'s card: {card.card_type.value}")
-
-            if card.card_type == CardType.SKULL:
+            if is_skull:
+                self._say(f"💀 SKULL REVEALED from {target_player.name}!")
+                self._say(f"Challenge failed!")
+                self.log(f"Revealed {target_player.name}'s card: {_CARD_NAME[SKULL]}")
                 self.log(f"💀 SKULL REVEALED! Challenge failed!")
                 self.skull_revealer = target_player
                 self.challenger.stats['challenges_lost'] += 1
                 self.handle_failed_challenge()
                 return True
 
+            self._say(f"🌹 ROSE REVEALED from {target_player.name}!")
+            self.log(f"Revealed {target_player.name}'s card: {_CARD_NAME[ROSE]}")
+
             if not target_player.played_cards:
-                other_players.remove(target_player)
+                # Order doesn't matter for a random pick, so swap-remove by index
+                other_players[target_index] = other_players[-1]
+                other_players.pop()
 
         # Challenge succeeded!
-        print(f"\n🎉 SUCCESS! All {self.current_bid} cards were roses!")
-        print(f"{self.challenger.name} wins the round!")
+        self._say(f"\n🎉 SUCCESS! All {self.current_bid} cards were roses!")
+        self._say(f"{self.challenger.name} wins the round!")
         self.log(f"🌹 Challenge succeeded! All {self.current_bid} cards were roses!")
         self.challenger.stats['challenges_won'] += 1
         self.game_stats['successful_challenges'] += 1
@@ -659,18 +809,24 @@ class InteractiveSkullGame:
         return True
 
 
+    def _retrieve_all(self):
+        """All players take their face-down cards back into hand"""
+        for player in self.players:
+            player.retrieve_cards()
+        self._table_dirty = True
+
     def handle_failed_challenge(self):
         """Handle the consequences of a failed challenge"""
-        print(f"\n💥 CHALLENGE FAILED!")
+        self._say(f"\n💥 CHALLENGE FAILED!")
         
 
         # Challenger loses a card, chosen if revealed own skull
         if self.skull_revealer == self.challenger:
             # Player revealed own skull: chooses card to lose (or random if AI)
             lost_card = None
-            if isinstance(self.challenger, InteractiveHumanPlayer):
+            if self.challenger.is_human:
                 lost_card = self.challenger.choose_card_to_lose()
-                if lost_card:
+                if lost_card is not None:
                     self.challenger.lose_chosen_card(lost_card)
             else:
                 lost_card = self.challenger.lose_random_card()
@@ -681,15 +837,15 @@ class InteractiveSkullGame:
             self.log(f"{self.skull_revealer.name}'s skull was revealed. {self.challenger.name} loses a random card")
 
         if self.challenger.is_eliminated:
-            print(f"⚰️ {self.challenger.name} is eliminated from the game!")
+            self.active_players.remove(self.challenger)
+            self._update_seating()
+            self._say(f"⚰️ {self.challenger.name} is eliminated from the game!")
             self.log(f"⚰️ {self.challenger.name} is eliminated from the game!")
             self.game_stats['eliminations'] += 1
 
-        # All players retrieve their cards
-        for player in self.players:
-            player.retrieve_cards()
+        self._retrieve_all()
 
-        wait_for_human_conformation("\nPress Enter to continue to next round...")
+        self.wait_for_confirmation("\nPress Enter to continue to next round...")
         self.start_new_round()
 
     def handle_successful_challenge(self):
@@ -698,18 +854,17 @@ class InteractiveSkullGame:
         self.log(f"🏆 {self.challenger.name} wins round {self.challenger.rounds_won}!")
 
         if self.challenger.rounds_won >= 2:
-            print(f"\n🎉🎉🎉 {self.challenger.name} WINS THE GAME! 🎉🎉🎉")
-            print(f"Congratulations! You won with {self.challenger.rounds_won} rounds!")
+            self._winner = self.challenger
+            self._say(f"\n🎉🎉🎉 {self.challenger.name} WINS THE GAME! 🎉🎉🎉")
+            self._say(f"Congratulations! You won with {self.challenger.rounds_won} rounds!")
             self.log(f"🎉 {self.challenger.name} WINS THE GAME! 🎉", force_print=True)
             self.game_state = GameState.GAME_OVER
             return
 
-        # All players retrieve their cards
-        for player in self.players:
-            player.retrieve_cards()
+        self._retrieve_all()
 
-        print(f"\n{self.challenger.name} needs one more round to win!")
-        wait_for_human_conformation("Press Enter to continue to next round...")
+        self._say(f"\n{self.challenger.name} needs one more round to win!")
+        self.wait_for_confirmation("Press Enter to continue to next round...")
         self.start_new_round()
 
     def start_new_round(self):
@@ -723,24 +878,24 @@ class InteractiveSkullGame:
         active_players = self.get_active_players()
         if len(active_players) <= 1:
             if active_players:
-                print(f"\n🎉 {active_players[0].name} wins by elimination! 🎉")
+                self._winner = active_players[0]
+                self._say(f"\n🎉 {active_players[0].name} wins by elimination! 🎉")
                 self.log(f"🎉 {active_players[0].name} wins by elimination! 🎉", force_print=True)
             else:
-                print("Game ends with no remaining players!")
+                self._say("Game ends with no remaining players!")
                 self.log("Game ends with no remaining players!", force_print=True)
             self.game_state = GameState.GAME_OVER
             return
 
         # Set first player for next round (challenger goes first)
         if self.challenger and not self.challenger.is_eliminated:
-            self.current_player_index = self.players.index(self.challenger)
+            self.current_player_index = self.challenger._seat
         else:
-            self.current_player_index = 0
-            while self.players[self.current_player_index].is_eliminated:
-                self.current_player_index = (self.current_player_index + 1) % len(self.players)
+            self.current_player_index = active_players[0]._seat
 
         # Reset game state
         self.current_bid = 0
+        self._active_bidders = 0
         self.challenger = None
         self.skull_revealer = None
         self.game_state = GameState.INITIAL_PLACEMENT
@@ -749,53 +904,35 @@ class InteractiveSkullGame:
 
     def play_turn(self) -> bool:
         """Execute one turn of the game. Returns True if game continues, False if over"""
-        if self.game_state == GameState.GAME_OVER:
+        if self.game_state is GameState.GAME_OVER:
             return False
 
-        try:
-            if self.game_state == GameState.INITIAL_PLACEMENT:
-                self.initial_card_placement()
-            elif self.game_state == GameState.CARD_PLACEMENT:
-                self.card_placement_phase()
-            elif self.game_state == GameState.BIDDING:
-                self.bidding_phase()
-            elif self.game_state == GameState.CHALLENGE:
-                self.challenge_phase()
-        except KeyboardInterrupt:
-            print("\n\nGame interrupted by user.")
-            self.game_state = GameState.GAME_OVER
-            return False
-        
-        for player in self.players:
-            if player.rounds_won >= 2:
-                self.game_state = GameState.GAME_OVER
-                return False
+        handler = self._phase_dispatch.get(self.game_state)
+        if handler:
+            handler()
 
-        return self.game_state != GameState.GAME_OVER
+        return self.game_state is not GameState.GAME_OVER
 
     def play_interactive_game(self):
         """Play a complete interactive game"""
-        print("\n" + "="*80)
-        print("🎲 WELCOME TO SKULL AND ROSES! 🎲")
-        print("="*80)
-        print("\nGame Rules:")
-        print("• Each player has 3 Roses and 1 Skull")
-        print("• Win 2 rounds by successfully completing challenges")  
-        print("• Challenge: Reveal your bid number of cards without hitting a skull")
-        print("• Lose cards when challenges fail, elimination at 0 cards")
-        print("• Type 'q' or 'quit' at any prompt to exit")
-        print("\nPress Ctrl+C at any time to quit the game")
-
-        players_info = []
-        for player in self.players:
-            if isinstance(player, InteractiveHumanPlayer):
-                players_info.append(f"👤 {player.name} (Human)")
-            else:
-                players_info.append(f"🤖 {player.name} (AI)")
+        self._say(
+            "\n" + "="*80 + "\n"
+            "🎲 WELCOME TO SKULL AND ROSES! 🎲\n"
+            + "="*80 + "\n"
+            "\nGame Rules:\n"
+            "• Each player has 3 Roses and 1 Skull\n"
+            "• Win 2 rounds by successfully completing challenges\n"
+            "• Challenge: Reveal your bid number of cards without hitting a skull\n"
+            "• Lose cards when challenges fail, elimination at 0 cards\n"
+            "• Type 'q' or 'quit' at any prompt to exit\n"
+            "\nPress Ctrl+C at any time to quit the game"
+        )
+
+        players_info = [f"{player.icon} {player.name} ({player.kind})" for player in self.players]
 
-        print(f"\nPlayers: {', '.join(players_info)}")
+        self._say(f"\nPlayers: {', '.join(players_info)}")
 
-        wait_for_human_conformation("\nPress Enter to start the game...")
+        self.wait_for_confirmation("\nPress Enter to start the game...")
 
         turn_count = 0
         max_turns = 500  # Prevent infinite games
@@ -804,16 +941,13 @@ class InteractiveSkullGame:
             while self.play_turn() and turn_count < max_turns:
                 turn_count += 1
 
-                # Check for game end
-                if self.game_state == GameState.GAME_OVER:
-                    break
-
             if turn_count >= max_turns:
-                print("\nGame ended due to turn limit.")
+                self._say("\nGame ended due to turn limit.")
 
             self.print_final_results()
 
         except KeyboardInterrupt:
+            self.game_state = GameState.GAME_OVER
             print("\n\nGame interrupted. Thanks for playing!")
         except Exception as e:
             print(f"\nGame error: {e}")
@@ -821,34 +955,36 @@ class InteractiveSkullGame:
 
     def print_final_results(self):
         """Print comprehensive final results"""
-        print("\n" + "="*60)
-        print("🏁 FINAL GAME RESULTS 🏁")
-        print("="*60)
-
-        active_players = self.get_active_players()
-        if active_players:
-            winner = max(active_players, key=lambda p: p.rounds_won)
+        lines = []
+        append = lines.append
+        append("\n" + "="*60)
+        append("🏁 FINAL GAME RESULTS 🏁")
+        append("="*60)
+
+        winner = self._winner
+        if winner is not None:
             if winner.rounds_won >= 2:
-                print(f"🏆 Winner: {winner.name} with {winner.rounds_won} rounds won!")
+                append(f"🏆 Winner: {winner.name} with {winner.rounds_won} rounds won!")
             else:
-                print(f"🏆 Winner by elimination: {winner.name}")
+                append(f"🏆 Winner by elimination: {winner.name}")
 
-        print(f"\n📊 Game Statistics:")
-        print(f"  • Total rounds played: {self.game_stats['total_rounds']}")
-        print(f"  • Total challenges attempted: {self.game_stats['total_challenges']}")
-        print(f"  • Successful challenges: {self.game_stats['successful_challenges']}")
-        print(f"  • Players eliminated: {self.game_stats['eliminations']}")
+        append(f"\n📊 Game Statistics:")
+        append(f"  • Total rounds played: {self.game_stats['total_rounds']}")
+        append(f"  • Total challenges attempted: {self.game_stats['total_challenges']}")
+        append(f"  • Successful challenges: {self.game_stats['successful_challenges']}")
+        append(f"  • Players eliminated: {self.game_stats['eliminations']}")
 
-        print(f"\n👥 Player Performance:")
+        append(f"\n👥 Player Performance:")
         for player in self.players:
             status = "ELIMINATED" if player.is_eliminated else "ACTIVE"
-            icon = "👤" if isinstance(player, InteractiveHumanPlayer) else "🤖"
-            print(f"  {icon} {player.name} [{status}]:")
-            print(f"     Rounds won: {player.rounds_won}")
-            print(f"     Cards remaining: {len(player.hand) + len(player.played_cards)}")
-            print(f"     Challenges: {player.stats['challenges_won']} won, {player.stats['challenges_lost']} lost")
-            print(f"     Cards played: {player.stats['skulls_played']} skulls, {player.stats['roses_played']} roses")
-            
+            append(f"  {player.icon} {player.name} [{status}]:")
+            append(f"     Rounds won: {player.rounds_won}")
+            append(f"     Cards remaining: {player.card_count}")
+            append(f"     Challenges: {player.stats['challenges_won']} won, {player.stats['challenges_lost']} lost")
+            append(f"     Cards played: {player.stats['skulls_played']} skulls, {player.stats['roses_played']} roses")
+
+        self._say("\n".join(lines))
+
 def create_interactive_game():
     """Create and return a sample interactive game setup"""
     print("🎲 SKULL AND ROSES - INTERACTIVE GAME SETUP 🎲")